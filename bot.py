@@ -1,18 +1,27 @@
 import discord
 from discord.ext import commands, tasks
-import json
+import aiohttp
 import asyncio
+import asyncpg
+import logging
 import os
-import psycopg2
 import re
-from tracker import fetch_price_dynamic  # Ensure this module is correctly implemented
+import time
+import orjson
+from functools import partial
+from pathlib import Path
+from tracker import (  # Ensure this module is correctly implemented
+    close_browser, fetch_price_dynamic, get_validators, init_browser, parse_price, seed_validators
+)
+
+# ✅ INFO and up only; tracker's per-fetch DEBUG lines are dropped before formatting
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 
 # ✅ Load selectors safely
 selectors = {}
 try:
-    with open("selectors/selectors.json", "r") as file:
-        selectors = json.load(file)
-except (FileNotFoundError, json.JSONDecodeError):
+    selectors = orjson.loads(Path("selectors/selectors.json").read_bytes())
+except (FileNotFoundError, orjson.JSONDecodeError):
     print("❌ ERROR: Invalid or missing selectors.json! Ensure it exists and is properly formatted.")
 
 # ✅ Retrieve bot token from environment variables
@@ -25,14 +34,18 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("❌ ERROR: Missing DATABASE_URL! Check Railway environment variables.")
 
-# ✅ Connect to PostgreSQL Database
-try:
-    conn = psycopg2.connect(DATABASE_URL)
-    c = conn.cursor()
+
+# ✅ (url, selector) → (etag, last_modified, price) as last stored, so cycles only write what changed
+_persisted_validators = {}
+
+
+async def setup_database():
+    """Create the connection pool and make sure the schema is up to date."""
+    pool = await asyncpg.create_pool(DATABASE_URL, min_size=2, max_size=10)
     print("✅ Connected to PostgreSQL!")
 
     # ✅ Create table if it does not exist
-    c.execute("""
+    await pool.execute("""
         CREATE TABLE IF NOT EXISTS products (
             id SERIAL PRIMARY KEY,
             user_id BIGINT,
@@ -40,18 +53,47 @@ try:
             product_name TEXT,
             url TEXT,
             css_selector TEXT,
-            target_price REAL
+            target_price DOUBLE PRECISION
         )
     """)
-    conn.commit()
 
-except Exception as e:
-    print("❌ Database connection failed:", e)
-    exit(1)  # Exit if the database connection fails
+    # ✅ Per-user lookups by name; the leading user_id column also serves user-only queries
+    await pool.execute("""
+        CREATE INDEX IF NOT EXISTS idx_products_user_name ON products (user_id, lower(product_name))
+    """)
+
+    # ✅ One-shot migration: REAL targets come back as e.g. 99.98999786 and never equal a scraped price
+    data_type = await pool.fetchval("""
+        SELECT data_type FROM information_schema.columns
+        WHERE table_name = 'products' AND column_name = 'target_price'
+    """)
+    if data_type == "real":
+        await pool.execute("""
+            ALTER TABLE products ALTER COLUMN target_price TYPE DOUBLE PRECISION
+            USING round(target_price::numeric, 2)
+        """)
+
+    # ✅ Last fetch's HTTP validators + price, so unchanged pages skip the browser across restarts
+    await pool.execute("""
+        ALTER TABLE products
+            ADD COLUMN IF NOT EXISTS last_etag TEXT,
+            ADD COLUMN IF NOT EXISTS last_modified TEXT,
+            ADD COLUMN IF NOT EXISTS last_price DOUBLE PRECISION
+    """)
+    await pool.execute("""
+        CREATE INDEX IF NOT EXISTS idx_products_page ON products (url, css_selector)
+    """)
+    for url, css_selector, *stored in await pool.fetch("""
+        SELECT DISTINCT ON (url, css_selector) url, css_selector, last_etag, last_modified, last_price
+        FROM products WHERE last_price IS NOT NULL
+    """):
+        seed_validators(url, css_selector, *stored)
+        _persisted_validators[url, css_selector] = tuple(stored)
+    return pool
+
 
 # ✅ Load config from config.json
-with open("config.json", "r") as file:
-    config = json.load(file)
+config = orjson.loads(Path("config.json").read_bytes())
 
 channel_id = int(config["channel_id"])  # Ensure channel_id is an integer
 
@@ -59,12 +101,150 @@ channel_id = int(config["channel_id"])  # Ensure channel_id is an integer
 intents = discord.Intents.default()
 intents.message_content = True  # Required for reading messages
 intents.members = True  # Enable member events (for welcoming users)
-bot = commands.Bot(command_prefix="!", intents=intents)
+
+
+class PriceBot(commands.Bot):
+    """Bot that owns the database pool and the HTTP session shared by every price fetch."""
+
+    pool = None
+    http_session = None
+    alert_channel = None  # Resolved once in on_ready
+
+    async def setup_hook(self):
+        # ✅ Connect to PostgreSQL Database
+        try:
+            self.pool = await setup_database()
+        except Exception as e:
+            print("❌ Database connection failed:", e)
+            exit(1)  # Exit if the database connection fails
+
+        # ✅ One pooled keep-alive session for the bot's lifetime
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300, keepalive_timeout=60)
+        )
+
+        # ✅ Launch Chromium once; each fetch opens its own lightweight context
+        await init_browser()
+
+    async def close(self):
+        # ✅ Stop the price loop first so no cycle runs against a closed pool, session or browser
+        task = price_checker.get_task()
+        price_checker.cancel()
+        if task and not task.done() and task is not asyncio.current_task():
+            await asyncio.gather(task, return_exceptions=True)
+
+        if self.http_session and not self.http_session.closed:
+            await self.http_session.close()
+        if self.pool:
+            await self.pool.close()
+        await close_browser()
+        await super().close()
+
+
+bot = PriceBot(command_prefix="!", intents=intents, help_command=None)  # Custom !help below
+
+# ✅ Product links must at least look like an http(s) URL
+_URL_RE = re.compile(r"https?://(?:[-\w.]|%[\da-fA-F]{2})+")
 
 # ✅ Track active commands to prevent duplicate execution
 active_commands = set()
 bot_started = False  # Prevent multiple instances
 
+# ✅ Cap concurrent page fetches so stores don't throttle us
+FETCH_SEM = asyncio.Semaphore(int(os.getenv("FETCH_CONCURRENCY", "8")))
+
+# ✅ Hard cap per fetch so one stuck page can't stall a whole cycle (per-store "timeout" overrides).
+# Sized above tracker's own waits (10s HEAD + 30s GET + 45s goto + 30s price wait) so those fire first.
+FETCH_TIMEOUT = float(os.getenv("FETCH_TIMEOUT", "120"))
+
+
+async def _bounded_fetch(url, selector, store=None):
+    """Fetch a price while holding a slot of the shared fetch semaphore."""
+    store_config = selectors.get(store, {})
+    timeout = store_config.get("timeout", FETCH_TIMEOUT)
+    engine = store_config.get("engine", "browser")  # "http" tries the raw HTML first
+    async with FETCH_SEM:
+        try:
+            # Timed inside the semaphore so queueing for a slot doesn't count against the page
+            return await asyncio.wait_for(
+                fetch_price_dynamic(url, selector, session=bot.http_session, engine=engine), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            print(f"⚠️ Timed out after {timeout}s fetching {url}")
+            return None
+
+
+# ✅ Discord embed limits (25 fields, 6000 chars, 256/1024-char field name/value) with some headroom for the title
+MAX_EMBED_FIELDS = 25
+MAX_EMBED_CHARS = 5500
+MAX_FIELD_NAME = 256
+MAX_FIELD_VALUE = 1024
+
+# ✅ Alert field templates, filled with str.format_map in price_checker
+DROP_ALERT = "🔥 Price Drop Alert! {name}"
+MATCH_ALERT = "🎯 Your target price matched! {name}"
+ALERT_BODY = "{mention} it's now **${price:.2f}** (target ${target:.2f})\n🔗 [Product Link]({url})"
+ALERT_BODY_NO_LINK = "{mention} it's now **${price:.2f}** (target ${target:.2f})"  # URL too long for a field
+
+# ✅ Recently fetched prices ((url, selector) → (timestamp, price)) so repeat checks skip the network
+PRICE_CACHE_TTL = 300  # seconds
+_price_cache = {}
+
+
+async def cached_fetch(url, selector, store=None):
+    """Return a price fetched within the last PRICE_CACHE_TTL seconds, else fetch it."""
+    now = time.monotonic()
+    cached = _price_cache.get((url, selector))
+    if cached and now - cached[0] < PRICE_CACHE_TTL:
+        return cached[1]
+
+    price = await _bounded_fetch(url, selector, store)
+    if price is not None:  # Don't pin failed fetches for the whole TTL
+        for key in [key for key, (fetched_at, _) in _price_cache.items() if now - fetched_at >= PRICE_CACHE_TTL]:
+            del _price_cache[key]
+        _price_cache[url, selector] = (now, price)
+    return price
+
+
+# ✅ Adaptive re-check schedule: url → (next_check_at, interval, last_price)
+MIN_CHECK_INTERVAL = 10 * 60  # One price_checker cycle
+MAX_CHECK_INTERVAL = 24 * 60 * 60
+SCHEDULE_SLACK = 60  # Absorbs loop jitter so a due URL isn't pushed back a whole cycle
+_schedule = {}
+
+
+def _is_due(url, now):
+    """Return True if `url` has never been checked or its next check time has arrived."""
+    entry = _schedule.get(url)
+    return entry is None or entry[0] <= now + SCHEDULE_SLACK
+
+
+def _reschedule(url, price, now):
+    """Back off URLs whose price hasn't moved; check changed ones again next cycle."""
+    entry = _schedule.get(url)
+    if entry and not _is_due(url, now):
+        return  # Already rescheduled this cycle by another product on the same page
+    if entry and entry[2] == price:
+        interval = min(MAX_CHECK_INTERVAL, entry[1] * 1.5)
+    else:
+        interval = MIN_CHECK_INTERVAL
+    # Entries a day overdue belong to pages nobody tracks any more (e.g. after !remove_product)
+    for stale_url in [u for u, (next_at, _, _) in _schedule.items() if next_at < now - MAX_CHECK_INTERVAL]:
+        del _schedule[stale_url]
+    _schedule[url] = (now + interval, interval, price)
+
+
+def _check_again_soon(url):
+    """Drop `url`'s backoff and cached price so the next cycle re-checks it against new targets."""
+    _schedule.pop(url, None)
+    for key in [key for key in _price_cache if key[0] == url]:
+        del _price_cache[key]
+
+
+def _check(msg, author_id, channel_id):
+    """Match replies from the same author in the same channel (compares IDs, not objects)."""
+    return msg.author.id == author_id and msg.channel.id == channel_id
+
 
 ### 📌 EVENT: BOT READY ###
 @bot.event
@@ -77,8 +257,9 @@ async def on_ready():
     print(f"✅ Bot logged in as {bot.user}")
     print(f"Bot is in these servers: {[guild.name for guild in bot.guilds]}")  # Debugging
     try:
-        channel = await bot.fetch_channel(channel_id)
-        await channel.send("🚀 Bot is now online and ready!")
+        # ✅ Resolve the alert channel once; get_channel reads the gateway cache
+        bot.alert_channel = bot.get_channel(channel_id) or await bot.fetch_channel(channel_id)
+        await bot.alert_channel.send("🚀 Bot is now online and ready!")
     except Exception as e:
         print(f"⚠️ Could not send startup message: {e}")
 
@@ -86,13 +267,20 @@ async def on_ready():
         price_checker.start()
 
 
+### 📌 EVENT: MESSAGE ###
+@bot.event
+async def on_message(message):
+    """Only hand prefixed, non-bot messages to the command parser."""
+    if message.author.bot or not message.content.startswith(bot.command_prefix):
+        return
+    await bot.process_commands(message)
+
+
 ### 📌 COMMAND: ADD PRODUCT ###
 @bot.command()
 async def add_product(ctx):
     """Guide the user to add a product step-by-step, storing the user ID."""
-    
-    def check(msg):
-        return msg.author == ctx.author and msg.channel == ctx.channel
+    check = partial(_check, author_id=ctx.author.id, channel_id=ctx.channel.id)
 
     if ctx.author.id in active_commands:
         await ctx.send("⚠️ **You already have an active add_product command!**")
@@ -124,7 +312,7 @@ async def add_product(ctx):
             msg = await bot.wait_for("message", check=check, timeout=10)
             url = msg.content.strip()
 
-            if not re.match(r"https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+", url):
+            if not _URL_RE.match(url):
                 await ctx.send("⚠️ **Invalid URL! Please enter a valid product link.**")
                 continue  # Ask again if invalid
 
@@ -135,27 +323,27 @@ async def add_product(ctx):
         while True:
             await ctx.send("💲 **Enter your target price:**")
             msg = await bot.wait_for("message", check=check, timeout=10)
-            try:
-                target_price = float(msg.content.strip())
+            # parse_price ignores signs, so reject "-5" here rather than reading it as 5
+            target_price = None if msg.content.strip().startswith("-") else parse_price(msg.content)
+            if target_price is not None and target_price > 0:
                 answers["target_price"] = target_price
                 break  # Break loop if valid
-            except ValueError:
-                await ctx.send("⚠️ **Invalid price! Please enter a valid number.**")
+            await ctx.send("⚠️ **Invalid price! Please enter a valid number.**")
 
         # ✅ Fetch Current Price
         selector = selectors[store]["price"]
-        current_price = await fetch_price_dynamic(url, selector)
+        current_price = await _bounded_fetch(url, selector, store)
 
         if not current_price:
             await ctx.send("⚠️ **Could not fetch the current price.** Please check the URL.")
             return
 
         # ✅ Save to Database
-        c.execute("""
+        await bot.pool.execute("""
             INSERT INTO products (user_id, store, product_name, url, css_selector, target_price)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """, (ctx.author.id, store, answers["product_name"], answers["url"], selector, answers["target_price"]))
-        conn.commit()
+            VALUES ($1, $2, $3, $4, $5, $6)
+        """, ctx.author.id, store, answers["product_name"], answers["url"], selector, answers["target_price"])
+        _check_again_soon(url)  # The page may already be backed off for another user's product
 
         # ✅ Confirmation Message with Current Price
         await ctx.send(
@@ -176,16 +364,20 @@ async def add_product(ctx):
 @bot.command()
 async def check_price(ctx, product_name: str):
     """Allow users to manually check the current price of their saved product."""
-    c.execute("SELECT url, css_selector FROM products WHERE user_id = %s AND product_name ILIKE %s", 
-              (ctx.author.id, product_name))
-    product = c.fetchone()
+    product = await bot.pool.fetchrow(
+        "SELECT store, url, css_selector FROM products WHERE user_id = $1 AND lower(product_name) = lower($2)",
+        ctx.author.id, product_name)
 
     if not product:
         await ctx.send(f"⚠️ **No product found with the name '{product_name}' for you.**")
         return
 
-    url, selector = product
-    price = await fetch_price_dynamic(url, selector)
+    store, url, selector = product
+    if not url or not selector:
+        await ctx.send(f"⚠️ **'{product_name}' has no URL or price selector saved.** Remove it and add it again.")
+        return
+
+    price = await cached_fetch(url, selector, store)
 
     if price:
         await ctx.send(f"✅ **{ctx.author.mention} The current price of '{product_name}' is:** 💲${price:.2f}\n🔗 [Product Link]({url})")
@@ -194,42 +386,126 @@ async def check_price(ctx, product_name: str):
 
 
 ### 📌 AUTOMATED PRICE CHECK ###
-@tasks.loop(minutes=10)
+async def _send_alerts(channel, alerts):
+    """Send (user_id, title, body) alerts as embeds grouped by user, pinging each user once."""
+    batches, size = [[]], 0
+    for user_id, title, body in sorted(alerts, key=lambda alert: alert[0]):
+        field_size = len(title) + len(body)
+        if batches[-1] and (len(batches[-1]) == MAX_EMBED_FIELDS or size + field_size > MAX_EMBED_CHARS):
+            batches.append([])
+            size = 0
+        batches[-1].append((user_id, title, body))
+        size += field_size
+
+    for batch in batches:
+        if not batch:
+            continue
+        embed = discord.Embed(title="📉 Price Alerts", color=discord.Color.red())
+        for _, title, body in batch:
+            embed.add_field(name=title, value=body, inline=False)
+        # Mentions inside embeds don't ping, so put each user in the message content once
+        mentions = " ".join(dict.fromkeys(f"<@{user_id}>" for user_id, _, _ in batch))
+        try:
+            await channel.send(content=mentions, embed=embed,
+                               allowed_mentions=discord.AllowedMentions(users=True))
+        except discord.HTTPException as e:
+            # One rejected batch mustn't stop the loop or the rest of the cycle
+            print(f"⚠️ Could not send price alerts: {e}")
+
+
+
+@tasks.loop(seconds=MIN_CHECK_INTERVAL)
 async def price_checker():
     """Automatically check product prices and notify if below or at the target price."""
-    channel = await bot.fetch_channel(channel_id)
-
-    c.execute("SELECT * FROM products")
-    products = c.fetchall()
+    channel = bot.alert_channel or await bot.fetch_channel(channel_id)
+
+    rows = await bot.pool.fetch(
+        "SELECT user_id, store, product_name, url, css_selector, target_price FROM products")
+    now = time.monotonic()
+
+    # ✅ Group products by page so each (url, selector) is fetched once per cycle,
+    # skipping misconfigured rows before they cost a browser launch
+    groups = {}
+    for product in rows:
+        url, css_selector = product["url"], product["css_selector"]
+        if url and css_selector and product["target_price"] is not None and _is_due(url, now):
+            groups.setdefault((url, css_selector), []).append(product)
+    if not groups:
+        return
 
-    for product in products:
-        product_id, user_id, store, product_name, url, css_selector, target_price = product
-        price = await fetch_price_dynamic(url, css_selector)
+    # ✅ Fetch all prices concurrently instead of one page at a time
+    prices = await asyncio.gather(
+        *(
+            cached_fetch(url, css_selector, products[0]["store"])
+            for (url, css_selector), products in groups.items()
+        ),
+        return_exceptions=True
+    )
 
-        if price:
-            mention = f"<@{user_id}>"
+    alerts = []
+    cache_updates = []
+    for ((url, css_selector), products), price in zip(groups.items(), prices):
+        if isinstance(price, Exception):
+            print(f"⚠️ Price check failed for {url}: {price}")
+            continue
+        if not price:
+            continue
+
+        _reschedule(url, price, now)
+        etag, last_modified = get_validators(url, css_selector)
+        # last_price is only read back alongside a validator, so don't store it without one
+        stored = (etag, last_modified, price if etag or last_modified else None)
+        if _persisted_validators.get((url, css_selector), (None, None, None)) != stored:
+            cache_updates.append((url, css_selector, *stored))
+        for user_id, store, product_name, url, css_selector, target_price in products:
             if price < target_price:
-                await channel.send(f"🔥 **{mention} Price Drop Alert!** {product_name} is now ${price:.2f}!\n🔗 {url}")
+                template = DROP_ALERT
             elif price == target_price:
-                await channel.send(f"🎯 **{mention} Your target price matched!** {product_name} is now ${price:.2f}!\n🔗 {url}")
-
+                template = MATCH_ALERT
+            else:
+                continue
+            fields = {"mention": f"<@{user_id}>", "name": product_name, "price": price,
+                      "target": target_price, "url": url}
+            body = ALERT_BODY.format_map(fields)
+            if len(body) > MAX_FIELD_VALUE:
+                body = ALERT_BODY_NO_LINK.format_map(fields)
+            alerts.append((user_id, template.format_map(fields)[:MAX_FIELD_NAME], body))
+
+    await _send_alerts(channel, alerts)
+
+    # ✅ Persist validators and prices so the conditional checks survive a restart,
+    # as one transaction per cycle. This is re-fetchable cache data, so an async commit is fine.
+    if cache_updates:
+        async with bot.pool.acquire() as con, con.transaction():
+            await con.execute("SET LOCAL synchronous_commit = off")
+            await con.executemany("""
+                UPDATE products SET last_etag = $3, last_modified = $4, last_price = $5
+                WHERE url = $1 AND css_selector = $2
+            """, cache_updates)
+        for url, css_selector, *stored in cache_updates:
+            _persisted_validators[url, css_selector] = tuple(stored)
 
 
 ### 📌 COMMAND: SET TARGET PRICE ###
 @bot.command()
 async def set_target(ctx, product_name: str, target_price: float):
     """Allow users to update their target price for a specific product."""
-    c.execute("SELECT * FROM products WHERE user_id = %s AND product_name ILIKE %s", 
-              (ctx.author.id, product_name))
-    product = c.fetchone()
+    if target_price <= 0:
+        await ctx.send("⚠️ **Invalid price! The target price must be greater than zero.**")
+        return
+
+    product = await bot.pool.fetchrow(
+        "SELECT url FROM products WHERE user_id = $1 AND lower(product_name) = lower($2)",
+        ctx.author.id, product_name)
 
     if not product:
         await ctx.send(f"⚠️ **No product found with the name '{product_name}' for you.**")
         return
 
-    c.execute("UPDATE products SET target_price = %s WHERE user_id = %s AND product_name ILIKE %s",
-              (target_price, ctx.author.id, product_name))
-    conn.commit()
+    await bot.pool.execute(
+        "UPDATE products SET target_price = $1 WHERE user_id = $2 AND lower(product_name) = lower($3)",
+        target_price, ctx.author.id, product_name)
+    _check_again_soon(product["url"])  # A new target may already be met by an unchanged, backed-off price
 
     await ctx.send(f"✅ **{ctx.author.mention} Your target price for '{product_name}' has been updated to ${target_price:.2f}!**")
 
@@ -240,8 +516,7 @@ async def remove_product(ctx, *, product_name: str):
     """Allow users to stop tracking a product using flexible name matching."""
     
     # Fetch all products tracked by the user
-    c.execute("SELECT product_name FROM products WHERE user_id = %s", (ctx.author.id,))
-    products = c.fetchall()
+    products = await bot.pool.fetch("SELECT product_name FROM products WHERE user_id = $1", ctx.author.id)
     
     # Check if user has any products
     if not products:
@@ -260,10 +535,9 @@ async def remove_product(ctx, *, product_name: str):
         return
 
     # Perform the deletion
-    c.execute("DELETE FROM products WHERE user_id = %s AND LOWER(product_name) = %s", 
-              (ctx.author.id, matched_product))
-    
-    conn.commit()
+    await bot.pool.execute("DELETE FROM products WHERE user_id = $1 AND lower(product_name) = $2",
+                           ctx.author.id, matched_product)
+
     await ctx.send(f"🗑️ **{ctx.author.mention} You have successfully stopped tracking '{matched_product}'.**")
 
 
@@ -271,8 +545,8 @@ async def remove_product(ctx, *, product_name: str):
 @bot.command(name="alerts")
 async def alerts(ctx):
     """Show all active price alerts for the user."""
-    c.execute("SELECT product_name, target_price FROM products WHERE user_id = %s", (ctx.author.id,))
-    products = c.fetchall()
+    products = await bot.pool.fetch("SELECT product_name, target_price FROM products WHERE user_id = $1",
+                                    ctx.author.id)
 
     if not products:
         await ctx.send(f"⚠️ **You have no active price alerts.** Use `!add_product` to start tracking.")
@@ -292,8 +566,7 @@ async def alerts(ctx):
 @bot.command()
 async def list_products(ctx):
     """Show all products the user is currently tracking."""
-    c.execute("SELECT product_name, url FROM products WHERE user_id = %s", (ctx.author.id,))
-    products = c.fetchall()
+    products = await bot.pool.fetch("SELECT product_name, url FROM products WHERE user_id = $1", ctx.author.id)
 
     if not products:
         await ctx.send(f"⚠️ **You are not tracking any products.** Use `!add_product` to start tracking.")
@@ -309,14 +582,7 @@ async def list_products(ctx):
     await ctx.send(embed=embed)
 
 
-# ✅ Initialize bot
-intents = discord.Intents.default()
-intents.message_content = True
-intents.members = True
-
-# ✅ Remove built-in help command to avoid conflicts
-bot.remove_command("help")
-
+### 📌 COMMAND: HELP MENU ###
 @bot.command(name="help")
 async def help_menu(ctx):
     """Engaging help command with categories and emojis."""
@@ -376,4 +642,4 @@ async def shutdown(ctx):
 
 
 # ✅ Run bot
-bot.run(bot_token)
+bot.run(bot_token, log_handler=None)  # Logging is configured by basicConfig above
@@ -0,0 +1,22 @@
+-- PostgreSQL settings for the bot's Railway database, derived from pgtune
+-- (https://pgtune.leopard.in.ua/) for: PostgreSQL 15+, web application,
+-- 1 GB RAM, 1 CPU, 50 connections, SSD storage. Rescale the memory values
+-- if the database plan has more RAM.
+--
+-- Apply once per database (needs superuser, which Railway's postgres user has):
+--     psql "$DATABASE_URL" -f db/tune.sql
+-- shared_buffers and max_connections only take effect after a restart;
+-- everything else is picked up by pg_reload_conf() below.
+
+ALTER SYSTEM SET max_connections = 50;
+ALTER SYSTEM SET shared_buffers = '256MB';
+ALTER SYSTEM SET effective_cache_size = '768MB';
+ALTER SYSTEM SET maintenance_work_mem = '64MB';
+ALTER SYSTEM SET work_mem = '4MB';
+ALTER SYSTEM SET wal_buffers = '8MB';
+ALTER SYSTEM SET checkpoint_completion_target = 0.9;
+ALTER SYSTEM SET default_statistics_target = 100;
+ALTER SYSTEM SET random_page_cost = 1.1;
+ALTER SYSTEM SET effective_io_concurrency = 200;
+
+SELECT pg_reload_conf();
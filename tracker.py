@@ -1,9 +1,69 @@
-import json
+import aiohttp
+import asyncio
+import logging
+import math
 import os
+import orjson
+from bs4 import BeautifulSoup
+from pathlib import Path
 from playwright.async_api import async_playwright
 import re
 
+logger = logging.getLogger("tracker")
+
 DATA_FILE = "data/products.json"
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# One Chromium process shared by every fetch; each fetch gets its own context
+_pw = None
+_browser = None
+_browser_lock = asyncio.Lock()
+
+# Chromium flags for headless scraping in a container: no GPU, no /dev/shm, no background services
+_BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+]
+
+# Resource types the price never depends on; aborted before Chromium downloads them
+_BLOCKED_RESOURCES = {"image", "media", "font", "stylesheet"}
+
+# Runs in the page: the price element's text once it contains a digit, else null (keep waiting)
+_PRICE_TEXT_JS = """selector => {
+    const text = document.querySelector(selector)?.textContent;
+    return text && /\\d/.test(text) ? text : null;
+}"""
+
+# HTTP validators from each page's last successful fetch: (url, selector) → (etag, last_modified, price)
+_validators = {}
+
+# Currency symbols and thousands separators in a bare price, e.g. "$1,299.99"
+_PRICE_NOISE = str.maketrans("", "", "$€£¥,")
+
+# First number in a price string, e.g. "Now $15.00 was $20" → "15.00", "Sale $.99" → ".99"
+_PRICE_RE = re.compile(r"(?:\d[\d,]*(?:\.\d+)?|\.\d+)")
+
+def parse_price(text: str | None) -> float | None:
+    """Extract the first price in `text` as a float, or None if there isn't one."""
+    if not text:
+        return None
+    # Fast path: most price elements hold just the price, so one C-level pass + float() does it.
+    # Only trusted when what's left is plain digits with at most one dot.
+    cleaned = text.strip().translate(_PRICE_NOISE)
+    digits = cleaned.replace(".", "", 1)
+    if digits.isascii() and digits.isdigit():
+        price = float(cleaned)
+        if math.isfinite(price):
+            return price
+    match = _PRICE_RE.search(text)
+    return float(match.group(0).replace(",", "")) if match else None
 
 def load_products():
     """Load product data from JSON file safely."""
@@ -11,53 +71,179 @@ def load_products():
         return {}  # Return an empty dictionary if no file exists
     
     try:
-        with open(DATA_FILE, "r") as file:
-            return json.load(file)
-    except (json.JSONDecodeError, FileNotFoundError):
+        return orjson.loads(Path(DATA_FILE).read_bytes())
+    except (orjson.JSONDecodeError, FileNotFoundError):
         return {}  # Return empty dictionary if JSON is corrupted
 
 def save_products(products):
     """Save product data to JSON file safely."""
     os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
-    with open(DATA_FILE, "w") as file:
-        json.dump(products, file, indent=4)
+    # Write to a temp file and swap it in so readers never see a half-written file
+    tmp_file = DATA_FILE + ".tmp"
+    Path(tmp_file).write_bytes(orjson.dumps(products, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, DATA_FILE)
+
+def _remember_validators(url, selector, response, price):
+    """Keep the page's ETag/Last-Modified so the next fetch can ask if it changed."""
+    headers = response.headers if response else {}
+    etag, last_modified = headers.get("etag"), headers.get("last-modified")
+    if etag or last_modified:
+        _validators[url, selector] = (etag, last_modified, price)
+    else:
+        _validators.pop((url, selector), None)
+
+def get_validators(url, selector):
+    """Return (etag, last_modified) from the page's last successful fetch, or (None, None)."""
+    etag, last_modified, _ = _validators.get((url, selector), (None, None, None))
+    return etag, last_modified
+
+def seed_validators(url, selector, etag, last_modified, price):
+    """Restore validators saved by an earlier run, unless this run already has fresher ones."""
+    if (etag or last_modified) and price is not None:
+        _validators.setdefault((url, selector), (etag, last_modified, price))
+
+async def _price_if_unchanged(url, selector, session):
+    """Return the last price for `url` if a conditional HEAD answers 304 Not Modified."""
+    cached = _validators.get((url, selector))
+    if session is None or cached is None:
+        return None
+
+    etag, last_modified, price = cached
+    headers = {"User-Agent": USER_AGENT}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    try:
+        async with session.head(url, headers=headers, allow_redirects=True,
+                                timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 304:
+                return price
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.debug("Conditional check failed for %s: %s", url, e)
+    return None
+
+async def init_browser():
+    """Start Playwright and launch the shared browser (again, if it has died)."""
+    global _pw, _browser
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _pw is None:
+                _pw = await async_playwright().start()
+            _browser = await _pw.chromium.launch(headless=True, args=_BROWSER_ARGS)  # Headless mode for Railway
+    return _browser
+
+async def close_browser():
+    """Close the shared browser and stop Playwright."""
+    global _pw, _browser
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _pw is not None:
+        await _pw.stop()
+        _pw = None
+
+async def _block_heavy_resources(route):
+    """Abort requests for images, media, fonts and stylesheets; let everything else through."""
+    if route.request.resource_type in _BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
 
-async def fetch_price_dynamic(url, selector=None):
+def _select_price_text(html, selector):
+    """Return the text of the first element matching `selector` in `html`, or None."""
+    element = BeautifulSoup(html, "html.parser").select_one(selector)
+    return element.get_text() if element else None
+
+async def fetch_price_http(url, selector, session):
+    """
+    Fetch the price from the page's static HTML with a plain GET (no browser).
+    :param url: URL of the product page.
+    :param selector: CSS selector for the price element.
+    :param session: Shared aiohttp.ClientSession.
+    :return: Extracted price, or None if the price isn't in the server-rendered HTML.
+    """
+    try:
+        async with session.get(url, headers={"User-Agent": USER_AGENT},
+                               timeout=aiohttp.ClientTimeout(total=30)) as response:
+            if response.status != 200:
+                return None
+            html = await response.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError, LookupError) as e:
+        # LookupError/UnicodeDecodeError: unknown or wrong charset in the response
+        logger.debug("HTTP fetch failed for %s: %s", url, e)
+        return None
+
+    try:
+        # Parsing a full product page is CPU-bound; keep it off the event loop
+        price_text = await asyncio.to_thread(_select_price_text, html, selector)
+    except Exception as e:  # e.g. a selector Playwright accepts but soupsieve can't parse
+        logger.debug("Could not read %r from static HTML of %s: %s", selector, url, e)
+        return None
+    cleaned_price = parse_price(price_text)
+    if cleaned_price is None:
+        return None
+
+    price = round(cleaned_price, 2)
+    _remember_validators(url, selector, response, price)
+    return price
+
+async def fetch_price_dynamic(url, selector=None, session=None, engine="browser"):
     """
     Fetch the price dynamically from a given URL using Playwright Async API.
     :param url: URL of the product page.
     :param selector: CSS selector for the price element (optional).
+    :param session: Shared aiohttp.ClientSession for plain HTTP requests (optional).
+    :param engine: "http" to try the static HTML before rendering, "browser" to always render.
     :return: Extracted price as a string or None if not found.
     """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)  # Headless mode for Railway
-        page = await browser.new_page()
-
-        try:
-            print(f"🔍 Debug: Fetching URL: {url}")
-            await page.set_extra_http_headers({
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            })
-            await page.goto(url, wait_until="domcontentloaded", timeout=90000)
-
-            if selector:
-                print(f"🔍 Debug: Using Selector: {selector}")
-                await page.wait_for_selector(selector, timeout=30000)
-                price_element = await page.query_selector(selector)
-                
-                if price_element:
-                    price_text = await price_element.text_content()
-                    print(f"💰 Raw Price Text: {price_text}")
-
-                    # Clean and format the extracted price
-                    cleaned_price = re.sub(r"[^\d\.]", "", price_text).strip()  # Remove non-numeric characters
-                    if cleaned_price:
-                        return round(float(cleaned_price), 2)  # Ensure valid price format
-
-            print(f"❌ Debug: No price element found using selector '{selector}'")
-            return None
-        except Exception as e:
-            print(f"❌ Debug: Error fetching price: {e}")
-            return None
-        finally:
-            await browser.close()
+    # ✅ Static-HTML stores don't need Chromium; fall back to it only if the selector misses
+    if engine == "http" and selector and session is not None:
+        # The price is in the document itself, so a 304 really means it hasn't changed.
+        # Browser-rendered prices come from JavaScript and can change under an unchanged document.
+        unchanged_price = await _price_if_unchanged(url, selector, session)
+        if unchanged_price is not None:
+            logger.debug("Not modified, reusing last price for %s", url)
+            return unchanged_price
+
+        price = await fetch_price_http(url, selector, session)
+        if price is not None:
+            return price
+        logger.debug("Price not in static HTML, rendering %s", url)
+
+    try:
+        browser = await init_browser()
+        context = await browser.new_context(user_agent=USER_AGENT)
+    except Exception as e:
+        logger.warning("Could not open a browser context for %s: %s", url, e)
+        return None
+
+    # Everything after new_context sits inside try so the context is closed even on cancellation
+    try:
+        await context.route("**/*", _block_heavy_resources)
+        page = await context.new_page()
+
+        logger.debug("Fetching URL: %s", url)
+        # Only wait for the navigation to commit; the price wait below decides when we're done
+        await page.goto(url, wait_until="commit", timeout=45000)
+
+        if selector:
+            logger.debug("Using selector: %s", selector)
+            # Resolves the moment the price is rendered and hands back its text in the same wait
+            handle = await page.wait_for_function(_PRICE_TEXT_JS, arg=selector, timeout=30000)
+            price_text = await handle.json_value()
+            logger.debug("Raw price text: %r", price_text)
+
+            cleaned_price = parse_price(price_text)
+            if cleaned_price is not None:
+                _validators.pop((url, selector), None)  # Rendered prices can't be validated by HTTP
+                return round(cleaned_price, 2)  # Ensure valid price format
+
+        logger.warning("No price element found on %s using selector %r", url, selector)
+        return None
+    except Exception as e:
+        logger.warning("Error fetching price from %s: %s", url, e)
+        return None
+    finally:
+        await context.close()